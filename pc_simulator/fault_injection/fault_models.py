@@ -5,7 +5,6 @@ This module provides functions to apply various fault types to cell and pack mod
 All functions support probabilistic parameters and time-dependent evolution.
 """
 
-import numpy as np
 from typing import Dict, Any, Optional, List, Union, Callable
 
 # Import at runtime - these should be available
@@ -20,6 +19,12 @@ except ImportError:
 from .fault_types import FaultType
 
 
+def _refresh_fault_flags(cell_or_pack) -> None:
+    """Let cell models recompute their cached fault flags after _fault_state changed."""
+    if hasattr(cell_or_pack, '_update_fault_flags'):
+        cell_or_pack._update_fault_flags()
+
+
 def apply_internal_short_circuit(cell, resistance_ohm: float,
                                  time_evolution: Optional[Callable] = None,
                                  current_time: float = 0.0,
@@ -65,6 +70,8 @@ def apply_internal_short_circuit(cell, resistance_ohm: float,
             cell._fault_state['internal_short']['degradation_rate'] = degradation_rate
         if 'min_resistance_ohm' not in cell._fault_state['internal_short']:
             cell._fault_state['internal_short']['min_resistance_ohm'] = min_resistance_ohm
+    
+    _refresh_fault_flags(cell)
 
 
 def apply_external_short_circuit(pack, resistance_ohm: float,
@@ -108,7 +115,7 @@ def apply_capacity_fade(cell, fade_factor: float,
     if time_evolution is not None:
         fade_factor = time_evolution(current_time)
     
-    fade_factor = np.clip(fade_factor, 0.1, 1.0)  # Minimum 10% capacity
+    fade_factor = min(max(fade_factor, 0.1), 1.0)  # Minimum 10% capacity
     
     if not hasattr(cell, '_fault_state'):
         cell._fault_state = {}
@@ -123,6 +130,8 @@ def apply_capacity_fade(cell, fade_factor: float,
         # Store original capacity if not already stored
         if 'original_capacity' not in cell._fault_state.get('capacity_fade', {}):
             cell._fault_state['capacity_fade']['original_capacity'] = cell._capacity_nominal_ah
+    
+    _refresh_fault_flags(cell)
 
 
 def apply_resistance_increase(cell, resistance_multiplier: float,
@@ -151,6 +160,8 @@ def apply_resistance_increase(cell, resistance_multiplier: float,
         'multiplier': resistance_multiplier,
         'active': True
     }
+    
+    _refresh_fault_flags(cell)
 
 
 def apply_thermal_runaway(cell, escalation_factor: float = 1.1,
@@ -183,6 +194,8 @@ def apply_thermal_runaway(cell, escalation_factor: float = 1.1,
         'initial_temp_c': initial_temp_c,
         'active': True
     }
+    
+    _refresh_fault_flags(cell)
 
 
 def apply_cell_imbalance(pack, cell_indices: List[int],
@@ -227,6 +240,8 @@ def apply_open_circuit(cell, resistance_ohm: float = 1e6) -> None:
         'resistance_ohm': resistance_ohm,
         'active': True
     }
+    
+    _refresh_fault_flags(cell)
 
 
 def apply_leakage_current(cell, leakage_current_ma: float,
@@ -253,6 +268,8 @@ def apply_leakage_current(cell, leakage_current_ma: float,
         'current_ma': leakage_current_ma,
         'active': True
     }
+    
+    _refresh_fault_flags(cell)
 
 
 def apply_overcharge(cell, voltage_limit_mv: float = 3700.0) -> None:
@@ -272,6 +289,8 @@ def apply_overcharge(cell, voltage_limit_mv: float = 3700.0) -> None:
         'voltage_limit_mv': voltage_limit_mv,
         'active': True
     }
+    
+    _refresh_fault_flags(cell)
 
 
 def apply_overdischarge(cell, voltage_limit_mv: float = 2500.0) -> None:
@@ -291,6 +310,8 @@ def apply_overdischarge(cell, voltage_limit_mv: float = 2500.0) -> None:
         'voltage_limit_mv': voltage_limit_mv,
         'active': True
     }
+    
+    _refresh_fault_flags(cell)
 
 
 def clear_fault(cell_or_pack, 
@@ -305,6 +326,8 @@ def clear_fault(cell_or_pack,
     if hasattr(cell_or_pack, '_fault_state'):
         if fault_type in cell_or_pack._fault_state:
             cell_or_pack._fault_state[fault_type]['active'] = False
+    
+    _refresh_fault_flags(cell_or_pack)
 
 
 def clear_all_faults(cell_or_pack) -> None:
@@ -317,6 +340,8 @@ def clear_all_faults(cell_or_pack) -> None:
     if hasattr(cell_or_pack, '_fault_state'):
         for fault_type in cell_or_pack._fault_state:
             cell_or_pack._fault_state[fault_type]['active'] = False
+    
+    _refresh_fault_flags(cell_or_pack)
 
 
 
@@ -0,0 +1,650 @@
+"""
+Structure-of-Arrays LiFePO₄ Cell State
+
+This module stores the state of many LiFePO₄ cells as one contiguous NumPy
+array per state variable (Structure of Arrays) instead of one Python object
+per cell. Cell physics parameters are shared with LiFePO4Cell so both
+representations always describe the same ECM.
+
+Use LiFePO4CellArray.from_cells() to gather the state of existing cell objects
+and copy_to_cells() to scatter it back (e.g. for fault injection, which works
+on individual LiFePO4Cell objects).
+
+LiFePO4CellArray.update() advances all N cells by one time step with
+whole-array NumPy operations. It follows LiFePO4Cell.update() step by step, so
+a pack stepped through the array gives the same voltages, SOC and temperatures
+as stepping each cell object in a Python loop. For large arrays the SOC and
+2RC integration runs as a multi-threaded numba kernel when numba is installed.
+"""
+
+import numpy as np
+from typing import Optional, Sequence, Tuple, Union
+
+from plant.cell_model import (
+    LiFePO4Cell, _MA_TO_A, _MS_TO_HOURS, _MS_TO_S, _OHM_TO_MOHM, _RUNAWAY_ONSET_C,
+    _ecm_step, _thermal_step
+)
+
+# Optional multi-threaded batch kernel
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+DTypeLike = Union[type, np.dtype, str]
+
+
+if _HAVE_NUMBA:
+    @njit(cache=True, parallel=True)
+    def _ecm_step_batch(soc, v_rc1, v_rc2, current_a, dt_sec, dt_hours,
+                        capacity_ah, capacity_nominal_ah, r1, c1, r2, c2):
+        """
+        Run _ecm_step() for every cell in place, spread over all cores.
+
+        Cells are independent within a tick (series coupling happens in the
+        pack model), so the loop has no cross-iteration dependencies.
+        """
+        for i in prange(soc.shape[0]):
+            soc_i, v_rc1_i, v_rc2_i = _ecm_step(
+                soc[i], v_rc1[i], v_rc2[i], current_a[i], dt_sec, dt_hours,
+                capacity_ah[i], capacity_nominal_ah[i], r1, c1, r2, c2
+            )
+            soc[i] = soc_i
+            v_rc1[i] = v_rc1_i
+            v_rc2[i] = v_rc2_i
+
+    @njit(cache=True, parallel=True)
+    def _thermal_step_batch(temp_c, ambient_temp_c, joule_power_w, dt_sec, active,
+                            thermal_mass, convection_coeff_area, radiation_coeff_area):
+        """
+        Run _thermal_step() in place for every cell selected by `active`, spread
+        over all cores (one pass instead of the NumPy temporaries per term).
+        """
+        for i in prange(temp_c.shape[0]):
+            if active[i]:
+                temp_c[i] = _thermal_step(
+                    temp_c[i], ambient_temp_c[i], joule_power_w[i], dt_sec,
+                    thermal_mass, convection_coeff_area, radiation_coeff_area
+                )
+
+
+class LiFePO4CellArray:
+    """
+    Structure-of-Arrays state container for N LiFePO₄ cells.
+
+    Each per-cell state variable of LiFePO4Cell (SOC, RC voltages, temperature,
+    aging state, ...) is stored as a 1-D array of length N, so pack-level code
+    can operate on all cells with whole-array NumPy operations.
+
+    The float state is float64 by default. dtype=np.float32 halves memory
+    traffic for very large arrays, but SOC and temperature are integrated in
+    that precision: per-step changes below ~1e-7 of the value (e.g. 1 ms steps
+    at low current) are rounded away, so use it only with coarse time steps.
+
+    Parameters:
+        num_cells: Number of cells
+        capacity_ah: Nominal capacity in Ah, scalar or per-cell array (default: 100Ah)
+        initial_soc: Initial SOC (0.0 to 1.0), scalar or per-cell array (default: 0.5)
+        temperature_c: Initial temperature in °C, scalar or per-cell array (default: 32.0)
+        cycles: Number of charge/discharge cycles, scalar or per-cell array (default: 0)
+        ambient_temp_c: Ambient temperature in °C, scalar or per-cell array (default: 32.0)
+        resistance_multiplier: Base resistance multiplier, scalar or per-cell array (default: 1.0)
+        dtype: Floating point type of the state arrays (default: np.float64)
+    """
+
+    # OCV lookup tables shared by all cells: rows are charge, average, discharge,
+    # indexed by current direction + 1 (same layout as LiFePO4Cell._OCV_LUT)
+    _SOC_TABLE = LiFePO4Cell._SOC_GRID
+    _OCV_TABLES = np.stack([LiFePO4Cell._OCV_CHARGE, LiFePO4Cell._OCV_AVG, LiFePO4Cell._OCV_DISCHARGE])
+
+    # Minimum terminal voltage enforced by LiFePO4Cell.update() (2510 mV)
+    MIN_VOLTAGE_V = 2.51
+
+    # Arrays at least this long use the numba batch kernels (if installed) for the
+    # thermal and SOC/RC steps; below it thread start-up costs more than the NumPy path
+    PARALLEL_MIN_CELLS = 4096
+
+    # Per-cell float state, named as the matching LiFePO4Cell attributes
+    _FLOAT_FIELDS = (
+        '_capacity_nominal_ah',
+        '_soc',
+        '_temperature_c',
+        '_ambient_temp_c',
+        '_base_resistance_multiplier',
+        '_v_rc1',
+        '_v_rc2',
+        '_hysteresis_soc',
+        '_calendar_aging_time_hours',
+        '_last_update_time_hours',
+        '_storage_soc',
+        '_storage_temp',
+        '_capacity_actual_ah',
+        '_resistance_multiplier',
+    )
+
+    def __init__(
+        self,
+        num_cells: int,
+        capacity_ah: ArrayLike = 100.0,
+        initial_soc: ArrayLike = 0.5,
+        temperature_c: ArrayLike = 32.0,
+        cycles: ArrayLike = 0,
+        ambient_temp_c: ArrayLike = 32.0,
+        resistance_multiplier: ArrayLike = 1.0,
+        dtype: DTypeLike = np.float64
+    ):
+        """
+        Initialize N cells with the same defaults as LiFePO4Cell.
+
+        Args:
+            num_cells: Number of cells
+            capacity_ah: Nominal capacity in Ah (scalar or array[N])
+            initial_soc: Initial state of charge 0.0-1.0 (scalar or array[N])
+            temperature_c: Initial temperature in °C (scalar or array[N])
+            cycles: Number of charge/discharge cycles (scalar or array[N])
+            ambient_temp_c: Ambient temperature in °C (scalar or array[N])
+            resistance_multiplier: Cell-to-cell resistance variation (scalar or array[N])
+            dtype: Floating point type of the state arrays (np.float64 or np.float32)
+        """
+        if num_cells < 1:
+            raise ValueError("num_cells must be at least 1")
+        n = int(num_cells)
+        self._num_cells = n
+        self._set_dtype(dtype)
+
+        self._capacity_nominal_ah = self._as_array(capacity_ah)
+
+        # State variables
+        self._soc = np.clip(self._as_array(initial_soc), 0.0, 1.0)
+        self._temperature_c = self._as_array(temperature_c)
+        self._ambient_temp_c = self._as_array(ambient_temp_c)
+        self._cycles = np.maximum(np.broadcast_to(np.asarray(cycles, dtype=np.int64), (n,)), 0)
+
+        # Base resistance multiplier (cell-to-cell variation)
+        self._base_resistance_multiplier = np.maximum(self._as_array(resistance_multiplier), 0.1)
+
+        # 2RC network state
+        self._v_rc1 = np.zeros(n, dtype=self._dtype)
+        self._v_rc2 = np.zeros(n, dtype=self._dtype)
+
+        # Hysteresis tracking (1 = discharging, -1 = charging, 0 = rest)
+        self._last_current_direction = np.zeros(n, dtype=np.int8)
+        self._hysteresis_soc = self._soc.copy()
+
+        # Last terminal voltage (rest OCV until the first update)
+        self._last_terminal_voltage_v = np.maximum(self.get_ocv(), self.MIN_VOLTAGE_V).astype(
+            self._dtype, copy=False
+        )
+
+        # Calendar aging tracking
+        self._calendar_aging_time_hours = np.zeros(n, dtype=self._dtype)
+        self._last_update_time_hours = np.zeros(n, dtype=self._dtype)
+        self._storage_soc = self._soc.copy()
+        self._storage_temp = self._temperature_c.copy()
+
+        # Aged capacity and resistance
+        self._capacity_actual_ah = np.empty(n, dtype=self._dtype)
+        self._resistance_multiplier = np.empty(n, dtype=self._dtype)
+        self._update_aging()
+
+        self._reset_faults()
+
+    def _set_dtype(self, dtype: DTypeLike):
+        """Select the float type of the state arrays and the matching OCV tables."""
+        self._dtype = np.dtype(dtype)
+        if self._dtype.kind != 'f':
+            raise ValueError(f"dtype must be a floating point type, got {self._dtype}")
+        self._ocv_tables = self._OCV_TABLES.astype(self._dtype)
+
+    def _as_array(self, value: ArrayLike) -> np.ndarray:
+        """Broadcast a scalar or per-cell sequence to a new state-dtype array[N]."""
+        return np.broadcast_to(np.asarray(value, dtype=self._dtype), (self._num_cells,)).copy()
+
+    def __len__(self) -> int:
+        return self._num_cells
+
+    @classmethod
+    def from_cells(cls, cells: Sequence[LiFePO4Cell], dtype: DTypeLike = np.float64) -> 'LiFePO4CellArray':
+        """
+        Gather the state of existing LiFePO4Cell objects into a new array container.
+
+        Args:
+            cells: Sequence of LiFePO4Cell objects
+            dtype: Floating point type of the state arrays (default: np.float64)
+
+        Returns:
+            LiFePO4CellArray with one row per cell
+        """
+        array = cls.__new__(cls)
+        array._num_cells = len(cells)
+        if array._num_cells < 1:
+            raise ValueError("cells must not be empty")
+        array._set_dtype(dtype)
+
+        for field in cls._FLOAT_FIELDS:
+            setattr(array, field, np.array([getattr(cell, field) for cell in cells], dtype=array._dtype))
+        array._cycles = np.array([cell._cycles for cell in cells], dtype=np.int64)
+        array._last_current_direction = np.array(
+            [cell._last_current_direction for cell in cells], dtype=np.int8
+        )
+        array._last_terminal_voltage_v = np.array(
+            [cell._last_terminal_voltage_v for cell in cells], dtype=array._dtype
+        )
+        array.load_faults(cells)
+        return array
+
+    def copy_to_cells(self, cells: Sequence[LiFePO4Cell]):
+        """
+        Scatter the array state back into LiFePO4Cell objects.
+
+        Args:
+            cells: Sequence of N LiFePO4Cell objects (same order as the array rows)
+        """
+        if len(cells) != self._num_cells:
+            raise ValueError(f"Expected {self._num_cells} cells, got {len(cells)}")
+
+        for i, cell in enumerate(cells):
+            for field in self._FLOAT_FIELDS:
+                setattr(cell, field, float(getattr(self, field)[i]))
+            cell._cycles = int(self._cycles[i])
+            cell._last_current_direction = int(self._last_current_direction[i])
+            cell._last_terminal_voltage_v = float(self._last_terminal_voltage_v[i])
+            if self._short_active[i]:
+                # Fault duration advanced by update(), so a later load_faults() resumes it
+                short_state = cell._fault_state['internal_short']
+                short_state['fault_duration_sec'] = float(self._short_duration_sec[i])
+                short_state['resistance_ohm'] = float(self._r_short_ohm[i])
+
+    def _update_aging(self, rows: Optional[np.ndarray] = None):
+        """
+        Update capacity and resistance (vectorized LiFePO4Cell._update_aging).
+
+        Args:
+            rows: Indices of the cells to update. If None, update all cells.
+        """
+        cell = LiFePO4Cell
+        if rows is None:
+            rows = slice(None)
+
+        # Cycle aging: Capacity fade
+        cycles = self._cycles[rows]
+        cycle_fade_factor = np.maximum(1.0 - cell.FADE_RATE * np.sqrt(cycles), 0.5)
+
+        # Calendar aging: Arrhenius temperature dependence and SOC dependence
+        storage_soc = self._storage_soc[rows]
+        calendar_hours = self._calendar_aging_time_hours[rows]
+        temp_kelvin = self._storage_temp[rows] + 273.15
+        arrhenius_factor = np.exp(
+            -cell.CALENDAR_AGING_ACTIVATION_ENERGY / (cell.GAS_CONSTANT * temp_kelvin)
+        )
+        soc_factor = (
+            storage_soc ** cell.CALENDAR_AGING_SOC_EXPONENT
+            + (1.0 - storage_soc) ** cell.CALENDAR_AGING_SOC_EXPONENT
+        ) / 2.0
+        calendar_fade = cell.CALENDAR_AGING_BASE_RATE * arrhenius_factor * soc_factor * calendar_hours
+        calendar_fade_factor = np.where(
+            calendar_hours > 0,
+            1.0 - np.minimum(calendar_fade, 0.3),  # Limit to 30% calendar fade
+            1.0
+        )
+
+        # Combined aging, limited to 50% overall fade
+        total_fade_factor = np.maximum(cycle_fade_factor * calendar_fade_factor, 0.5)
+        self._capacity_actual_ah[rows] = self._capacity_nominal_ah[rows] * total_fade_factor
+
+        # Resistance increase: Only cycle-based
+        self._resistance_multiplier[rows] = 1.0 + cell.RESISTANCE_INCREASE_RATE * cycles
+
+    def _reset_faults(self):
+        """Clear all per-cell fault masks."""
+        n = self._num_cells
+        self._leakage_ma = np.zeros(n, dtype=self._dtype)
+        self._short_active = np.zeros(n, dtype=bool)
+        self._r_short_ohm = np.zeros(n, dtype=self._dtype)  # Degraded value of the current tick
+        self._short_initial_ohm = np.zeros(n, dtype=self._dtype)
+        self._short_degradation_rate = np.zeros(n, dtype=self._dtype)
+        self._short_min_ohm = np.zeros(n, dtype=self._dtype)
+        self._short_duration_sec = np.zeros(n, dtype=self._dtype)  # Time since the short started
+        self._min_voltage_v = np.full(n, self.MIN_VOLTAGE_V, dtype=self._dtype)
+
+    def load_faults(self, cells: Sequence[LiFePO4Cell]):
+        """
+        Gather the active faults of LiFePO4Cell objects into per-cell fault masks.
+
+        Faults are injected on individual cells (see fault_injection.fault_models),
+        so call this after injecting or clearing faults to make update() see them.
+
+        Supported faults:
+        - leakage_current: constant self-discharge current
+        - internal_short: short current, its heating and the voltage divider. The
+          short resistance degrades every tick like in LiFePO4Cell, from the
+          fault's fault_duration_sec at load time, advanced by dt in update()
+          (copy_to_cells() writes it back)
+        - overdischarge: voltage limit (the 2.51V floor still applies)
+        - overcharge: accepted, the ECM has no upper voltage clamp to lift
+
+        Args:
+            cells: Sequence of N LiFePO4Cell objects (same order as the array rows)
+
+        Raises:
+            ValueError: If a cell has an active fault the array cannot model
+        """
+        if len(cells) != self._num_cells:
+            raise ValueError(f"Expected {self._num_cells} cells, got {len(cells)}")
+
+        self._reset_faults()
+        for i, cell in enumerate(cells):
+            fault_state = getattr(cell, '_fault_state', None) or {}
+            for fault_type, params in fault_state.items():
+                if not params.get('active', False):
+                    continue
+                if fault_type == 'leakage_current':
+                    self._leakage_ma[i] = params.get('current_ma', 0.0)
+                elif fault_type == 'internal_short':
+                    # Same parameters as LiFePO4Cell._update_fault_flags()
+                    self._short_active[i] = True
+                    self._short_initial_ohm[i] = params.get(
+                        'initial_resistance_ohm', params.get('resistance_ohm', 0.1)
+                    )
+                    self._short_degradation_rate[i] = params.get('degradation_rate', 0.0001)
+                    self._short_min_ohm[i] = params.get('min_resistance_ohm', 0.001)
+                    self._short_duration_sec[i] = params.get('fault_duration_sec', 0.0)
+                elif fault_type == 'overdischarge':
+                    voltage_limit_v = params.get('voltage_limit_mv', 2500.0) / 1000.0
+                    self._min_voltage_v[i] = max(voltage_limit_v, self.MIN_VOLTAGE_V)
+                elif fault_type == 'overcharge':
+                    pass  # No upper voltage clamp in the ECM
+                else:
+                    raise ValueError(
+                        f"Fault '{fault_type}' on cell {i} is not supported by LiFePO4CellArray"
+                    )
+
+    def _soc_temp_arrays(
+        self, soc_pct: Optional[ArrayLike], temperature_c: Optional[ArrayLike]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Resolve optional SOC (%) / temperature overrides to per-cell arrays."""
+        soc = self._soc if soc_pct is None else np.clip(self._as_array(soc_pct) / 100.0, 0.0, 1.0)
+        temp = self._temperature_c if temperature_c is None else self._as_array(temperature_c)
+        return soc, temp
+
+    def get_ocv(
+        self,
+        soc_pct: Optional[ArrayLike] = None,
+        temperature_c: Optional[ArrayLike] = None,
+        current_direction: Optional[ArrayLike] = None
+    ) -> np.ndarray:
+        """
+        Get OCV of all cells (vectorized LiFePO4Cell.get_ocv, same argument order).
+
+        Args:
+            soc_pct: SOC in percent, scalar or array[N]. If None, use current SOC.
+            temperature_c: Temperature in °C, scalar or array[N]. If None, use current temperature.
+            current_direction: Per-cell direction (1=discharge, -1=charge, 0=rest).
+                               Rest and None use the last known direction (average
+                               curve if there is none yet).
+
+        Returns:
+            OCV in volts, array[N]
+        """
+        soc, temp = self._soc_temp_arrays(soc_pct, temperature_c)
+        if current_direction is None:
+            current_direction = self._last_current_direction
+        else:
+            current_direction = np.sign(np.broadcast_to(current_direction, (self._num_cells,)))
+            current_direction = np.where(current_direction != 0, current_direction, self._last_current_direction)
+        table_index = current_direction.astype(np.intp) + 1
+
+        # Uniform 1% SOC grid: locate the segment directly instead of searching
+        position = soc * (len(self._SOC_TABLE) - 1)
+        lower = np.minimum(position.astype(np.intp), len(self._SOC_TABLE) - 2)
+        fraction = np.subtract(position, lower, dtype=self._dtype)
+        ocv_lower = self._ocv_tables[table_index, lower]
+        ocv_upper = self._ocv_tables[table_index, lower + 1]
+        ocv_base = ocv_lower + fraction * (ocv_upper - ocv_lower)
+
+        return ocv_base + LiFePO4Cell.OCV_TEMP_COEFF * (temp - 25.0)
+
+    def get_internal_resistance(
+        self, soc_pct: Optional[ArrayLike] = None, temperature_c: Optional[ArrayLike] = None
+    ) -> np.ndarray:
+        """
+        Get R0 of all cells (vectorized LiFePO4Cell.get_internal_resistance).
+
+        Args:
+            soc_pct: SOC in percent, scalar or array[N]. If None, use current SOC.
+            temperature_c: Temperature in °C, scalar or array[N]. If None, use current temperature.
+
+        Returns:
+            Internal resistance in mΩ, array[N]
+        """
+        soc, temp = self._soc_temp_arrays(soc_pct, temperature_c)
+        return self._get_r0_ohm(soc, temp) * _OHM_TO_MOHM
+
+    def _get_r0_ohm(self, soc: Optional[np.ndarray] = None, temp: Optional[np.ndarray] = None) -> np.ndarray:
+        """R0 of all cells in Ω (SI units for the ECM math in update()), at the current state by default."""
+        if soc is None:
+            soc = self._soc
+        if temp is None:
+            temp = self._temperature_c
+        r0_base_multiplier = np.where(soc <= 0.5, 1.4 - soc * 0.8, 1.0 - (soc - 0.5) * 0.5)
+        temp_factor = np.maximum(1.0 - 0.005 * (temp - 25.0), 0.5)
+        return (0.5e-3 * r0_base_multiplier * temp_factor
+                * self._base_resistance_multiplier * self._resistance_multiplier)
+
+    def _calculate_thermal_runaway_heat(self) -> np.ndarray:
+        """
+        Heat from thermal runaway exothermic reactions (vectorized
+        LiFePO4Cell._calculate_thermal_runaway_heat).
+
+        Returns:
+            Additional heat generation power in Watts, array[N]
+        """
+        temp_c = self._temperature_c
+        power_w = np.zeros(self._num_cells, dtype=self._dtype)
+        hot = temp_c >= _RUNAWAY_ONSET_C
+        if not hot.any():
+            return power_w
+
+        t = temp_c[hot]
+        stage_power_w = np.where(t < 120.0, 0.5 * np.exp((np.minimum(t, 120.0) - _RUNAWAY_ONSET_C) / 10.0), 5.0)
+        stage_power_w += np.where(
+            t >= 120.0, np.where(t < 150.0, 2.0 * np.exp((np.clip(t, 120.0, 150.0) - 120.0) / 8.0), 20.0), 0.0
+        )
+        stage_power_w += np.where(
+            t >= 150.0, np.where(t < 200.0, 5.0 * np.exp((np.clip(t, 150.0, 200.0) - 150.0) / 10.0), 50.0), 0.0
+        )
+        stage_power_w += np.where(t >= 200.0, 100.0 * np.exp((np.maximum(t, 200.0) - 200.0) / 5.0), 0.0)
+        power_w[hot] = stage_power_w
+        return power_w
+
+    def _update_thermal_model(self, current_ma: np.ndarray, dt_sec: float, active: np.ndarray):
+        """
+        Update temperature of the cells selected by `active` (vectorized
+        LiFePO4Cell._update_thermal_model, including its idle fast path).
+
+        Args:
+            current_ma: Current in mA, array[N]
+            dt_sec: Time step in seconds
+            active: Boolean mask of cells whose temperature is not forced
+        """
+        cell = LiFePO4Cell
+        temp_diff = self._temperature_c - self._ambient_temp_c
+        active = active & ~(
+            (np.abs(current_ma) < cell.THERMAL_IDLE_CURRENT_MA)
+            & (np.abs(temp_diff) < cell.THERMAL_IDLE_DELTA_C)
+            & (self._temperature_c < _RUNAWAY_ONSET_C)
+        )
+        if not active.any():
+            return
+
+        current_a = current_ma * _MA_TO_A
+        power_w = current_a ** 2 * self._get_r0_ohm()
+
+        if _HAVE_NUMBA and self._num_cells >= self.PARALLEL_MIN_CELLS:
+            # Convection, radiation, runaway heat and clamp per cell, multi-threaded and in place
+            _thermal_step_batch(
+                self._temperature_c, self._ambient_temp_c, power_w, dt_sec, active,
+                cell.THERMAL_MASS, cell._CONVECTION_COEFF_AREA, cell._RADIATION_COEFF_AREA
+            )
+            return
+
+        q_conv_w = cell._CONVECTION_COEFF_AREA * temp_diff
+        # T_cell^4 - T_ambient^4 factored as in _thermal_step()
+        t_cell_k = self._temperature_c + 273.15
+        t_ambient_k = self._ambient_temp_c + 273.15
+        q_rad_w = cell._RADIATION_COEFF_AREA * (
+            (t_cell_k * t_cell_k + t_ambient_k * t_ambient_k) * (t_cell_k + t_ambient_k) * temp_diff
+        )
+
+        net_power_w = power_w + self._calculate_thermal_runaway_heat() - (q_conv_w + q_rad_w)
+        new_temp_c = np.clip(self._temperature_c + net_power_w * dt_sec / cell.THERMAL_MASS, -40.0, 200.0)
+        self._temperature_c = np.where(active, new_temp_c, self._temperature_c)
+
+    def _step_ecm_numpy(self, current_a: np.ndarray, dt_sec: float, dt_hours: float,
+                        capacity_ah: np.ndarray):
+        """Coulomb counting and 2RC network update with whole-array NumPy operations."""
+        cell = LiFePO4Cell
+        # In place, like the batch kernel: no new SOC array per tick
+        self._soc -= current_a * dt_hours / capacity_ah
+        np.clip(self._soc, 0.0, 1.0, out=self._soc)
+
+        # 2RC network with C-rate dependent resistances (tau > 0 always: scale >= 0.3)
+        current_c_rate = np.abs(current_a) / self._capacity_nominal_ah
+        # Branchless form of _ecm_step()'s select: the excess over 1C is 0 at low
+        # C-rates, which gives exactly 1.0, so no np.where is needed
+        excess_c_rate = np.maximum(current_c_rate - 1.0, 0.0)
+        rc_scale_factor = np.maximum(1.0 / (1.0 + 0.15 * excess_c_rate), 0.3)
+        r1_effective = cell.R1 * rc_scale_factor
+        r2_effective = cell.R2 * rc_scale_factor
+        one_minus_exp1 = -np.expm1(-dt_sec / (r1_effective * cell.C1))
+        one_minus_exp2 = -np.expm1(-dt_sec / (r2_effective * cell.C2))
+        self._v_rc1 = self._v_rc1 * (1.0 - one_minus_exp1) + current_a * r1_effective * one_minus_exp1
+        self._v_rc2 = self._v_rc2 * (1.0 - one_minus_exp2) + current_a * r2_effective * one_minus_exp2
+
+    def update(
+        self,
+        current_ma: ArrayLike,
+        dt_ms: float,
+        temperature_c: Optional[ArrayLike] = None,
+        ambient_temp_c: Optional[ArrayLike] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Update all cells by one time step (vectorized LiFePO4Cell.update).
+
+        Args:
+            current_ma: Current in mA (positive = discharge, negative = charge),
+                        scalar (series string) or array[N]
+            dt_ms: Time step in milliseconds
+            temperature_c: Forced temperature in °C (optional), scalar or array[N];
+                           NaN entries keep the thermal model for that cell
+            ambient_temp_c: Ambient temperature in °C (optional), scalar or array[N]
+
+        Returns:
+            Tuple of (terminal_voltage_mv, soc_pct), each array[N]
+        """
+        cell = LiFePO4Cell
+        current_ma = self._as_array(current_ma)
+        dt_sec = dt_ms * _MS_TO_S
+        dt_hours = dt_ms * _MS_TO_HOURS
+
+        # Thermal model, or forced temperature where given
+        if ambient_temp_c is not None:
+            self._ambient_temp_c = self._as_array(ambient_temp_c)
+        if temperature_c is None:
+            self._update_thermal_model(current_ma, dt_sec, np.ones(self._num_cells, dtype=bool))
+        else:
+            forced_temp_c = self._as_array(temperature_c)
+            forced = ~np.isnan(forced_temp_c)
+            self._update_thermal_model(current_ma, dt_sec, ~forced)
+            self._temperature_c = np.where(forced, forced_temp_c, self._temperature_c)
+
+        # Fault currents drawn inside the cell (zero on healthy cells): leakage, and
+        # the internal short at I = OCV / R_short with its V * I heating
+        cell_current_ma = current_ma - self._leakage_ma
+        if self._short_active.any():
+            # Inverse degradation R(t) = R_initial / (1 + k * t), floored at the
+            # minimum resistance (as LiFePO4Cell._update_short_circuit_state())
+            r_short_ohm = self._short_initial_ohm / (
+                1.0 + self._short_degradation_rate * self._short_duration_sec
+            )
+            self._r_short_ohm = np.where(
+                self._short_active, np.maximum(r_short_ohm, self._short_min_ohm), 0.0
+            ).astype(self._dtype)
+            ocv = self.get_ocv()
+            i_short_a = np.divide(
+                ocv, self._r_short_ohm, out=np.zeros_like(ocv),
+                where=self._short_active & (self._r_short_ohm > 0)
+            )
+            cell_current_ma -= i_short_a * 1000.0
+            self._temperature_c += ocv * i_short_a * dt_sec / cell.THERMAL_MASS
+
+        # Temperature-dependent capacity
+        capacity_ah = self._capacity_actual_ah * (
+            1.0 + cell.CAPACITY_TEMP_COEFF * (self._temperature_c - 25.0)
+        )
+
+        current_a = cell_current_ma * _MA_TO_A
+        if _HAVE_NUMBA and self._num_cells >= self.PARALLEL_MIN_CELLS:
+            # Coulomb counting and 2RC network, multi-threaded and in place
+            _ecm_step_batch(
+                self._soc, self._v_rc1, self._v_rc2, current_a, dt_sec, dt_hours,
+                capacity_ah, self._capacity_nominal_ah, cell.R1, cell.C1, cell.R2, cell.C2
+            )
+        else:
+            self._step_ecm_numpy(current_a, dt_sec, dt_hours, capacity_ah)
+
+        # Current direction and hysteresis tracking
+        new_direction = np.where(current_ma > 0.001, 1, np.where(current_ma < -0.001, -1, 0))
+        changed = (new_direction != 0) & (new_direction != self._last_current_direction)
+        self._hysteresis_soc = np.where(changed, self._soc, self._hysteresis_soc)
+        self._last_current_direction = np.where(
+            new_direction != 0, new_direction, self._last_current_direction
+        ).astype(np.int8)
+
+        # Terminal voltage: V = OCV - |I|*R0 - |V_RC1| - |V_RC2|
+        # (rest falls back to the last known direction, which is already updated)
+        ocv = self.get_ocv()
+        r0_ohm = self._get_r0_ohm()
+        v_terminal = (ocv - np.abs(current_a) * r0_ohm
+                      - np.abs(self._v_rc1) - np.abs(self._v_rc2))
+
+        # Internal short: voltage divider with R0 plus structural impedance
+        if self._short_active.any():
+            r_internal_effective_ohm = r0_ohm + cell.SHORT_STRUCTURAL_IMPEDANCE_OHM
+            shorted = self._short_active & (self._r_short_ohm > 0)
+            # Ratio 1.0 leaves healthy cells untouched, so one multiply covers the pack
+            voltage_divider_ratio = np.where(
+                shorted, self._r_short_ohm / (r_internal_effective_ohm + self._r_short_ohm), 1.0
+            )
+            np.multiply(v_terminal, voltage_divider_ratio, out=v_terminal)
+            # The short has now lasted one more time step
+            np.add(
+                self._short_duration_sec, dt_sec,
+                out=self._short_duration_sec, where=self._short_active
+            )
+
+        # Minimum voltage (2.51V, or a higher overdischarge fault limit) in one
+        # branchless pass; the per-cell floor is only rebuilt when faults change.
+        # There is no upper clamp: the ECM never limits the charge voltage, with or
+        # without an overcharge fault.
+        np.maximum(v_terminal, self._min_voltage_v, out=v_terminal)
+
+        # Calendar aging bookkeeping
+        self._calendar_aging_time_hours += dt_hours
+        np.copyto(self._storage_soc, self._soc, where=(new_direction == 0))  # At rest
+
+        # Hourly aging update, only for the (rare) rows that are due; storage
+        # temperature is only read there, so it is sampled then
+        aging_due = np.flatnonzero(self._calendar_aging_time_hours - self._last_update_time_hours > 1.0)
+        if aging_due.size:
+            self._storage_temp[aging_due] = self._temperature_c[aging_due]
+            self._update_aging(aging_due)
+            self._last_update_time_hours[aging_due] = self._calendar_aging_time_hours[aging_due]
+
+        self._last_terminal_voltage_v = v_terminal
+        voltage_mv = v_terminal * 1000.0
+        np.maximum(voltage_mv, 2510.0, out=voltage_mv)
+        return voltage_mv, self._soc * 100.0
@@ -100,7 +100,9 @@ def save_current_model_state(checkpoint_name="checkpoint_1"):
     parameters = {
         # OCV tables - access class attributes directly
         'ocv_soc_table_discharge': LiFePO4Cell._OCV_SOC_TABLE_DISCHARGE.tolist(),
-        'ocv_soc_table_charge': LiFePO4Cell._OCV_SOC_TABLE_CHARGE.tolist(),
+        'ocv_soc_table_charge': np.column_stack(
+            (LiFePO4Cell._OCV_SOC_TABLE_DISCHARGE[:, 0], LiFePO4Cell._OCV_CHARGE)
+        ).tolist(),
         
         # ECM parameters
         'R1': float(LiFePO4Cell.R1),
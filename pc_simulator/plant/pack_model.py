@@ -205,7 +205,7 @@ class BatteryPack16S:
             if self._fault_temperatures[i] is None:  # Don't override fault temperatures
                 temp_change = (coupling_energy[i] * dt_sec) / thermal_mass
                 cell._temperature_c += temp_change
-                cell._temperature_c = np.clip(cell._temperature_c, -40.0, 85.0)
+                cell._temperature_c = min(max(cell._temperature_c, -40.0), 85.0)
     
     def get_cell_voltages(self) -> np.ndarray:
         """
@@ -0,0 +1,164 @@
+"""
+Validate the vectorized LiFePO4CellArray against per-cell LiFePO4Cell objects.
+
+Steps N cells both ways with the same current profile and compares the results
+every tick:
+1. Fault-free cells (mixed SOC, temperature, capacity, aging)
+2. Faulted cells (leakage, internal short, overdischarge, overcharge)
+3. Forced temperatures (update() with a per-cell temperature override)
+4. Parallel numba kernels (when numba is installed)
+
+Terminal voltage, SOC and temperature must match within tolerance.
+"""
+
+import numpy as np
+import sys
+
+from plant.cell_model import LiFePO4Cell
+from plant.cell_array import LiFePO4CellArray, _HAVE_NUMBA
+
+# Configure output encoding for Windows
+if sys.platform == 'win32':
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(encoding='utf-8')
+
+REL_TOLERANCE = 1e-9
+TEMP_TOLERANCE_C = 1e-9
+DT_MS = 1000.0
+
+
+def _make_cells(num_cells: int, faults: bool):
+    """Build cells with spread-out initial states, optionally with faults injected."""
+    cells = [
+        LiFePO4Cell(
+            capacity_ah=100.0 + (i % 8),
+            initial_soc=0.05 + 0.9 * i / max(num_cells - 1, 1),
+            temperature_c=25.0 + 2.0 * (i % 10),
+            cycles=100 * (i % 12),
+            ambient_temp_c=30.0,
+            resistance_multiplier=1.0 + 0.02 * (i % 5),
+        )
+        for i in range(num_cells)
+    ]
+    if faults:
+        for i, cell in enumerate(cells):
+            if i % 5 == 1:
+                cell._fault_state['leakage_current'] = {'active': True, 'current_ma': 2000.0}
+            elif i % 5 == 2:
+                cell._fault_state['internal_short'] = {
+                    'active': True, 'resistance_ohm': 0.5, 'initial_resistance_ohm': 0.5,
+                    'degradation_rate': 0.001, 'min_resistance_ohm': 0.001, 'fault_duration_sec': 0.0,
+                }
+            elif i % 5 == 3:
+                cell._fault_state['overdischarge'] = {'active': True, 'voltage_limit_mv': 2800.0}
+            elif i % 5 == 4:
+                cell._fault_state['overcharge'] = {'active': True, 'voltage_limit_mv': 3800.0}
+            cell._update_fault_flags()
+    return cells
+
+
+def _compare(num_cells: int, steps: int, faults: bool = False, forced_temp: bool = False):
+    """Step cells and array side by side; return the worst voltage/SOC/temperature errors."""
+    cells = _make_cells(num_cells, faults)
+    array = LiFePO4CellArray.from_cells(cells)
+
+    forced_temps = None
+    if forced_temp:
+        # NaN keeps the thermal model, a value forces that cell's temperature
+        forced_temps = np.full(num_cells, np.nan)
+        forced_temps[::3] = 40.0
+
+    worst_v = worst_soc = worst_temp = 0.0
+    for k in range(steps):
+        current_ma = 100000.0 * np.sin(k / 300.0)
+
+        # The fault framework advances the short duration with simulation time
+        if k > 0:
+            for cell in cells:
+                short_state = cell._fault_state.get('internal_short')
+                if short_state and short_state.get('active'):
+                    short_state['fault_duration_sec'] += DT_MS / 1000.0
+
+        reference = np.array([
+            cell.update(
+                current_ma, DT_MS,
+                None if forced_temps is None or np.isnan(forced_temps[i]) else forced_temps[i]
+            )
+            for i, cell in enumerate(cells)
+        ])
+        voltage_v, soc_pct = array.update(current_ma, DT_MS, forced_temps)
+        cell_temps = np.array([cell._temperature_c for cell in cells])
+
+        worst_v = max(worst_v, np.max(np.abs(voltage_v - reference[:, 0]) / reference[:, 0]))
+        worst_soc = max(worst_soc, np.max(
+            np.abs(soc_pct - reference[:, 1]) / np.maximum(reference[:, 1], 1e-9)
+        ))
+        worst_temp = max(worst_temp, np.max(np.abs(array._temperature_c - cell_temps)))
+
+    return worst_v, worst_soc, worst_temp
+
+
+def _check(name: str, worst_v: float, worst_soc: float, worst_temp: float) -> bool:
+    """Print one check's errors and whether they are within tolerance."""
+    print(f"  Voltage max rel error: {worst_v:.3e}")
+    print(f"  SOC max rel error: {worst_soc:.3e}")
+    print(f"  Temperature max abs error: {worst_temp:.3e}°C")
+    if worst_v <= REL_TOLERANCE and worst_soc <= REL_TOLERANCE and worst_temp <= TEMP_TOLERANCE_C:
+        print(f"  ✓ PASS: {name} match")
+        return True
+    print(f"  ❌ FAIL: {name} differ beyond tolerance")
+    return False
+
+
+def validate_cell_array(num_cells: int = 16, steps: int = 3000):
+    """Validate LiFePO4CellArray against LiFePO4Cell for num_cells cells."""
+    print("="*70)
+    print("VALIDATING VECTORIZED CELL ARRAY")
+    print("="*70)
+    print(f"  Cells: {num_cells}, Steps: {steps}, dt: {DT_MS:.0f}ms")
+    print(f"  Numba: {'available' if _HAVE_NUMBA else 'not installed (NumPy path only)'}")
+
+    all_passed = True
+
+    print(f"\n[Check 1] Fault-free cells:")
+    all_passed &= _check("Fault-free cells", *_compare(num_cells, steps))
+
+    print(f"\n[Check 2] Faulted cells (leakage, internal short, overdischarge, overcharge):")
+    all_passed &= _check("Faulted cells", *_compare(num_cells, steps, faults=True))
+
+    print(f"\n[Check 3] Forced temperatures:")
+    all_passed &= _check("Forced temperatures", *_compare(num_cells, steps, forced_temp=True))
+
+    print(f"\n[Check 4] Parallel numba kernels:")
+    if _HAVE_NUMBA:
+        parallel_min_cells = LiFePO4CellArray.PARALLEL_MIN_CELLS
+        LiFePO4CellArray.PARALLEL_MIN_CELLS = 0
+        try:
+            all_passed &= _check("Parallel kernels", *_compare(num_cells, steps, faults=True))
+        finally:
+            LiFePO4CellArray.PARALLEL_MIN_CELLS = parallel_min_cells
+    else:
+        print(f"  - SKIPPED: numba not installed")
+
+    # Summary
+    print(f"\n{'='*70}")
+    print("VALIDATION SUMMARY")
+    print(f"{'='*70}")
+
+    if all_passed:
+        print("✓ ALL CHECKS PASSED")
+    else:
+        print("❌ SOME CHECKS FAILED")
+    return all_passed
+
+
+if __name__ == "__main__":
+    num_cells = 16
+    steps = 3000
+    if len(sys.argv) > 1:
+        num_cells = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        steps = int(sys.argv[2])
+
+    success = validate_cell_array(num_cells, steps)
+    sys.exit(0 if success else 1)